@@ -3,18 +3,42 @@ Callback Handler Lambda Function
 
 Sends migration status to callback URL, updates external systems.
 """
+import asyncio
 import os
 import json
-from typing import Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Any, List
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from common.logger import get_logger
-from common.correlation import extract_correlation_id
+from common.correlation import extract_correlation_id, propagate_context
 from common.errors import MigrationError
+from common.serialization import dumps_bytes
 
 logger = get_logger(__name__)
 
+# Module-level session so warm Lambda containers reuse keep-alive
+# connections instead of paying a TCP+TLS handshake per callback.
+# Retries cover transient gateway errors; callbacks are idempotent on
+# migrationId, so replaying the POST is safe.
+_session = requests.Session()
+_retry = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=[502, 503, 504],
+    allowed_methods=["POST"],
+)
+_adapter = HTTPAdapter(
+    pool_connections=10, pool_maxsize=50, max_retries=_retry
+)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
 
 def send_callback(
     callback_url: str,
@@ -23,20 +47,34 @@ def send_callback(
 ) -> Dict[str, Any]:
     """Send callback to external system."""
     logger.info("Sending callback", extra={"url": callback_url})
-    
+
     try:
-        response = requests.post(
+        # Time the round trip directly instead of deriving it from
+        # response.elapsed, which allocates a timedelta per call
+        started = time.perf_counter()
+        # Serialize once up front rather than letting requests run the
+        # payload through stdlib json internally
+        response = _session.post(
             callback_url,
-            json=payload,
+            data=dumps_bytes(payload),
             timeout=timeout,
             headers={
                 "Content-Type": "application/json",
                 "X-Migration-Callback": "true",
             },
         )
-        
-        response.raise_for_status()
-        
+        response_time = time.perf_counter() - started
+
+        if response.status_code >= 400:
+            raise MigrationError(
+                f"Callback returned error status: {response.status_code}",
+                "CALLBACK_ERROR",
+                details={
+                    "url": callback_url,
+                    "statusCode": response.status_code,
+                },
+            )
+
         logger.info(
             "Callback sent successfully",
             extra={
@@ -44,13 +82,13 @@ def send_callback(
                 "url": callback_url,
             },
         )
-        
+
         return {
             "status": "SUCCESS",
             "statusCode": response.status_code,
-            "responseTime": response.elapsed.total_seconds(),
+            "responseTime": response_time,
         }
-        
+
     except requests.exceptions.RequestException as e:
         logger.error(
             "Callback request failed",
@@ -66,6 +104,36 @@ def send_callback(
         )
 
 
+# Bounded pool for multi-target fanout; the worker count caps
+# concurrent POSTs the way a semaphore would
+_fanout_executor = ThreadPoolExecutor(max_workers=10)
+
+
+def send_callbacks(
+    callback_urls: List[str],
+    payload: Dict[str, Any],
+    timeout: int = 30,
+) -> List[Dict[str, Any]]:
+    """Send the callback to multiple targets concurrently."""
+
+    def _send_one(url: str) -> Dict[str, Any]:
+        try:
+            return send_callback(url, payload, timeout)
+        except MigrationError as e:
+            return {"status": "FAILED", "error": e.to_dict()}
+
+    async def _fanout() -> List[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(
+            *(
+                loop.run_in_executor(_fanout_executor, _send_one, url)
+                for url in callback_urls
+            )
+        )
+
+    return asyncio.run(_fanout())
+
+
 def format_callback_payload(event: Dict[str, Any]) -> Dict[str, Any]:
     """Format event for callback."""
     detail = event.get("detail", {})
@@ -76,7 +144,7 @@ def format_callback_payload(event: Dict[str, Any]) -> Dict[str, Any]:
         "appName": detail.get("appName"),
         "environment": detail.get("environment"),
         "wave": detail.get("wave"),
-        "timestamp": __import__("datetime").datetime.utcnow().isoformat(),
+        "timestamp": datetime.utcnow().isoformat(),
         "correlationId": extract_correlation_id(event),
     }
     
@@ -111,11 +179,12 @@ def lambda_handler(event, context):
     try:
         detail = event.get("detail", {})
         correlation_id = extract_correlation_id(event)
-        logger.set_correlation_id(correlation_id)
+        propagate_context(correlation_id)
         
         migration_id = detail.get("migrationId")
         callback_url = detail.get("callbackUrl")
-        
+        callback_urls = detail.get("callbackUrls")
+
         logger.info(
             "Processing callback",
             extra={
@@ -123,7 +192,29 @@ def lambda_handler(event, context):
                 "callbackUrl": callback_url,
             },
         )
-        
+
+        # Fan out concurrently when multiple targets are configured
+        if callback_urls:
+            callback_payload = format_callback_payload(event)
+            fanout_results = send_callbacks(callback_urls, callback_payload)
+
+            logger.info(
+                "Callback fanout completed",
+                extra={
+                    "migrationId": migration_id,
+                    "targets": len(callback_urls),
+                },
+            )
+
+            return {
+                "statusCode": 200,
+                "body": {
+                    "migrationId": migration_id,
+                    "status": "CALLBACK_SENT",
+                    "details": fanout_results,
+                },
+            }
+
         # Check if callback URL is provided
         if not callback_url:
             logger.warning(
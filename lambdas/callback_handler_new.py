@@ -3,19 +3,52 @@ Callback Handler Lambda Function
 Sends migration status to callback URL, updates external systems
 """
 
+import asyncio
 import json
 import logging
+import time
 import boto3
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any, Tuple
 from datetime import datetime
 
 from common.logger import get_logger
-from common.correlation import get_correlation_id, propagate_context
+from common.correlation import get_correlation_id
+from common.serialization import dumps_bytes
+from common.aws_clients import get_client, get_dynamodb_resource
 
 logger = get_logger(__name__)
-dynamodb = boto3.resource('dynamodb')
-secrets_client = boto3.client('secretsmanager')
+dynamodb = get_dynamodb_resource()
+secrets_client = get_client('secretsmanager')
+
+# Reuse one session across warm invocations to keep callback
+# connections alive instead of reconnecting per request
+# POSTs are idempotent on migrationId, so transient 5xx responses are
+# retried with backoff instead of surfacing as lost callbacks
+http_session = requests.Session()
+_retry = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=[502, 503, 504],
+    allowed_methods=['POST']
+)
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=_retry)
+http_session.mount('https://', _adapter)
+http_session.mount('http://', _adapter)
+
+
+# Static callback headers, built once instead of per request
+BASE_HEADERS = {
+    'Content-Type': 'application/json',
+    'X-Migration-Source': 'AWS-MGN-Orchestrator'
+}
+
+# Cache the auth header across warm invocations so we don't hit
+# Secrets Manager (network + KMS decrypt) on every callback
+AUTH_CACHE_TTL_SECONDS = 300
+_auth_cache = {'header': {}, 'expires': 0.0}
 
 
 def get_auth_header(callback_url: str) -> Dict[str, str]:
@@ -24,19 +57,25 @@ def get_auth_header(callback_url: str) -> Dict[str, str]:
         # Check if auth is required
         if '/api/' not in callback_url:
             return {}
-        
+
+        # Serve from cache while the TTL is fresh
+        if time.monotonic() < _auth_cache['expires']:
+            return _auth_cache['header']
+
         # Try to get auth token from Secrets Manager
         try:
             secret = secrets_client.get_secret_value(
                 SecretId='migration/callback-auth'
             )
             auth_token = json.loads(secret['SecretString']).get('token')
-            
+
             if auth_token:
-                return {'Authorization': f'Bearer {auth_token}'}
+                _auth_cache['header'] = {'Authorization': f'Bearer {auth_token}'}
+                _auth_cache['expires'] = time.monotonic() + AUTH_CACHE_TTL_SECONDS
+                return _auth_cache['header']
         except secrets_client.exceptions.ResourceNotFoundException:
             logger.warning("No auth secret found for callback")
-        
+
         return {}
 
     except Exception as e:
@@ -53,22 +92,18 @@ def send_callback(callback_url: str, status_payload: Dict[str, Any]) -> Tuple[bo
         
         logger.info(f"Sending callback to: {callback_url}")
         
+        # Single merge: static base + auth + correlation ID
         headers = {
-            'Content-Type': 'application/json',
-            'X-Migration-Source': 'AWS-MGN-Orchestrator'
+            **BASE_HEADERS,
+            **get_auth_header(callback_url),
+            'X-Correlation-ID': status_payload.get('correlationId', '')
         }
         
-        # Add auth if available
-        auth_headers = get_auth_header(callback_url)
-        headers.update(auth_headers)
-        
-        # Add correlation ID
-        headers['X-Correlation-ID'] = status_payload.get('correlationId', '')
-        
         # Set timeout for request
-        response = requests.post(
+        # Pre-serialized body skips requests' internal json encoder
+        response = http_session.post(
             callback_url,
-            json=status_payload,
+            data=dumps_bytes(status_payload),
             headers=headers,
             timeout=30
         )
@@ -93,22 +128,26 @@ def update_cmdb(migration_id: str, status_payload: Dict[str, Any]) -> bool:
     try:
         logger.info(f"Updating CMDB for migration: {migration_id}")
         
-        # Store in DynamoDB for CMDB integration
+        # Store in DynamoDB for CMDB integration. Fields are written as
+        # native attributes rather than one JSON-blob column, so readers
+        # can project/filter server-side without re-parsing.
         table = dynamodb.Table('migration-state')
-        
-        cmdb_update = {
-            'timestamp': datetime.utcnow().isoformat(),
-            'migrationId': migration_id,
-            'status': status_payload.get('status'),
-            'appName': status_payload.get('appName'),
-            'targetInstanceId': status_payload.get('targetInstanceId'),
-            'targetIpAddress': status_payload.get('targetIpAddress')
-        }
-        
+
         table.update_item(
             Key={'migrationId': migration_id},
-            UpdateExpression='SET cmdbUpdate = :update',
-            ExpressionAttributeValues={':update': json.dumps(cmdb_update)}
+            UpdateExpression=(
+                'SET cmdbTimestamp = :ts, #status = :status, '
+                'appName = :app, targetInstanceId = :instance, '
+                'targetIpAddress = :ip'
+            ),
+            ExpressionAttributeNames={'#status': 'status'},
+            ExpressionAttributeValues={
+                ':ts': datetime.utcnow().isoformat(),
+                ':status': status_payload.get('status'),
+                ':app': status_payload.get('appName'),
+                ':instance': status_payload.get('targetInstanceId'),
+                ':ip': status_payload.get('targetIpAddress')
+            }
         )
         
         logger.info(f"CMDB updated for {migration_id}")
@@ -123,14 +162,14 @@ def format_callback_payload(event: Dict[str, Any]) -> Dict[str, Any]:
     """Format the callback payload with migration status"""
     migration_id = event.get('migrationId') or event.get('detail', {}).get('migrationId')
     payload = event.get('detail', event)
-    
-    callback_payload = {
+
+    fields = {
         'migrationId': migration_id,
         'appName': payload.get('appName'),
         'status': event.get('status', 'IN_PROGRESS'),
         'launchType': event.get('launchType'),
         'jobId': event.get('jobId'),
-        'timestamp': int(datetime.utcnow().timestamp() * 1000),
+        'timestamp': time.time_ns() // 1_000_000,
         'correlationId': event.get('correlationId'),
         'jobStatus': event.get('jobStatus'),
         'targetInstanceId': event.get('targetInstanceId'),
@@ -143,8 +182,19 @@ def format_callback_payload(event: Dict[str, Any]) -> Dict[str, Any]:
         'wave': payload.get('wave'),
         'environment': payload.get('environment')
     }
-    
-    return callback_payload
+
+    # Drop absent fields so they don't inflate the callback body or the
+    # DynamoDB item with explicit nulls
+    return {k: v for k, v in fields.items() if v is not None}
+
+
+async def _dispatch_callback_and_cmdb(callback_url, migration_id, callback_payload):
+    """Run the callback POST and CMDB update concurrently"""
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(
+        loop.run_in_executor(None, send_callback, callback_url, callback_payload),
+        loop.run_in_executor(None, update_cmdb, migration_id, callback_payload)
+    )
 
 
 def lambda_handler(event, context):
@@ -157,7 +207,6 @@ def lambda_handler(event, context):
         dict: Callback result
     """
     correlation_id = get_correlation_id()
-    propagate_context(correlation_id)
     
     migration_id = event.get('migrationId') or event.get('detail', {}).get('migrationId')
     logger.info(f"Processing callback for migration: {migration_id}")
@@ -172,16 +221,16 @@ def lambda_handler(event, context):
         
         logger.info(f"Callback payload: {json.dumps(callback_payload)}")
         
-        # Send callback to external system
-        success, message = send_callback(callback_url, callback_payload)
-        
+        # Send callback and update CMDB in parallel - they are independent,
+        # so wall time becomes max(HTTP, DynamoDB) instead of the sum
+        (success, message), cmdb_success = asyncio.run(
+            _dispatch_callback_and_cmdb(callback_url, migration_id, callback_payload)
+        )
+
         if not success:
             logger.warning(f"Callback delivery failed: {message}")
             # Don't fail the migration if callback fails, just log it
-        
-        # Update CMDB
-        cmdb_success = update_cmdb(migration_id, callback_payload)
-        
+
         if not cmdb_success:
             logger.warning(f"CMDB update failed for {migration_id}")
         
@@ -0,0 +1,29 @@
+"""Shared boto3 clients and resources with tuned connection settings."""
+from functools import lru_cache
+
+import boto3
+from botocore.config import Config
+
+# One config for every client: keep-alive avoids re-handshaking TLS to
+# AWS endpoints on warm invocations, the pool is sized for concurrent
+# calls from a single container, and tight timeouts keep a hung AWS
+# call from eating the whole Lambda timeout.
+CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"mode": "adaptive", "max_attempts": 3},
+    tcp_keepalive=True,
+    connect_timeout=2,
+    read_timeout=10,
+)
+
+
+@lru_cache(maxsize=None)
+def get_client(service: str, region: str = "us-east-1"):
+    """Get a memoized boto3 client for a service."""
+    return boto3.client(service, region_name=region, config=CLIENT_CONFIG)
+
+
+@lru_cache(maxsize=None)
+def get_dynamodb_resource(region: str = "us-east-1"):
+    """Get a memoized DynamoDB resource."""
+    return boto3.resource("dynamodb", region_name=region, config=CLIENT_CONFIG)
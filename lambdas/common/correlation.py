@@ -1,29 +1,54 @@
 """Correlation ID management for distributed tracing."""
-import uuid
+import secrets
+from contextvars import ContextVar
 from typing import Optional
 
+# Current correlation ID for this execution context; contextvars keep
+# concurrent threads/tasks in one container from clobbering each other
+_current_correlation_id: ContextVar[Optional[str]] = ContextVar(
+    "correlation_id", default=None
+)
+
 
 def generate_correlation_id() -> str:
     """Generate a unique correlation ID."""
-    return f"mig-{uuid.uuid4().hex[:8]}"
+    # token_hex(4) yields the same 8 hex chars as uuid4().hex[:8]
+    # without generating 16 random bytes and a UUID object first
+    return f"mig-{secrets.token_hex(4)}"
 
 
 def extract_correlation_id(event: dict) -> str:
     """Extract correlation ID from event or generate new one."""
-    # Try to get from various sources
-    if "correlation_id" in event:
-        return event["correlation_id"]
-    
-    if "detail" in event and "correlation_id" in event.get("detail", {}):
-        return event["detail"]["correlation_id"]
-    
-    if "headers" in event:
-        correlation_id = event["headers"].get("X-Correlation-ID")
-        if correlation_id:
-            return correlation_id
-    
-    # Generate new if not found
-    return generate_correlation_id()
+    # Single-pass lookup chain over the known sources. The event is not
+    # mutated here: raw SQS bodies are schema-validated with
+    # additionalProperties=false, so callers memoize explicitly via
+    # inject_correlation_id instead.
+    return (
+        event.get("correlationId")
+        or event.get("correlation_id")
+        or event.get("detail", {}).get("correlation_id")
+        or event.get("headers", {}).get("X-Correlation-ID")
+        or generate_correlation_id()
+    )
+
+
+def get_correlation_id() -> str:
+    """Return the current correlation ID, generating one if unset."""
+    correlation_id = _current_correlation_id.get()
+    if correlation_id is None:
+        correlation_id = generate_correlation_id()
+        _current_correlation_id.set(correlation_id)
+    return correlation_id
+
+
+def propagate_context(correlation_id: str) -> None:
+    """Make a correlation ID visible to downstream code in this context.
+
+    Warm containers often re-enter with the same trace, so an unchanged
+    ID short-circuits before the contextvar write.
+    """
+    if _current_correlation_id.get() != correlation_id:
+        _current_correlation_id.set(correlation_id)
 
 
 def inject_correlation_id(event: dict, correlation_id: str) -> dict:
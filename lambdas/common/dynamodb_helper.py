@@ -1,16 +1,20 @@
 """DynamoDB helper utilities for migration state tracking."""
-import boto3
-from typing import Dict, Any, Optional, List
+import time
+
+from typing import Dict, Any, Iterator, Optional, List
 from datetime import datetime
 
+from common.aws_clients import get_dynamodb_resource
+
 
 class MigrationStateManager:
     """Manages migration state in DynamoDB."""
 
     def __init__(self, table_name: str, region: str = "us-east-1"):
         """Initialize DynamoDB client and table."""
-        self.dynamodb = boto3.resource("dynamodb", region_name=region)
+        self.dynamodb = get_dynamodb_resource(region)
         self.table = self.dynamodb.Table(table_name)
+        self.table_name = table_name
 
     def save_migration_state(
         self,
@@ -33,6 +37,60 @@ class MigrationStateManager:
         
         self.table.put_item(Item=item)
 
+    def save_migration_states_bulk(
+        self,
+        states: List[Dict[str, Any]],
+        max_retries: int = 3,
+    ) -> None:
+        """Save multiple migration states via BatchWriteItem.
+
+        Items are written in chunks of 25 (the BatchWriteItem limit), so
+        bulk callers pay one round trip per chunk instead of one per item.
+        Unprocessed items are retried with exponential backoff.
+        """
+        updated_at = datetime.utcnow().isoformat()
+        items = [
+            {
+                "migrationId": state["migrationId"],
+                "status": state.get("status", "PENDING"),
+                "wave": state.get("wave"),
+                "appName": state.get("appName"),
+                "source": state.get("source"),
+                "target": state.get("target"),
+                "environment": state.get("environment"),
+                "updatedAt": updated_at,
+                "executionDetails": state.get("executionDetails", {}),
+                "correlationId": state.get("correlationId"),
+            }
+            for state in states
+        ]
+
+        for start in range(0, len(items), 25):
+            request_items = {
+                self.table_name: [
+                    {"PutRequest": {"Item": item}}
+                    for item in items[start:start + 25]
+                ]
+            }
+
+            for attempt in range(max_retries + 1):
+                response = self.dynamodb.batch_write_item(
+                    RequestItems=request_items
+                )
+                unprocessed = response.get("UnprocessedItems", {})
+
+                if not unprocessed:
+                    break
+
+                if attempt == max_retries:
+                    raise Exception(
+                        f"Unprocessed items after {max_retries} retries: "
+                        f"{sum(len(v) for v in unprocessed.values())}"
+                    )
+
+                time.sleep(0.1 * (2 ** attempt))
+                request_items = unprocessed
+
     def get_migration_state(self, migration_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve migration state from DynamoDB."""
         response = self.table.get_item(Key={"migrationId": migration_id})
@@ -62,30 +120,74 @@ class MigrationStateManager:
             ExpressionAttributeValues=expression_values,
         )
 
-    def query_by_wave(self, wave: str) -> List[Dict[str, Any]]:
-        """Query migrations by wave."""
-        response = self.table.query(
+    def _query_all_pages(self, **query_kwargs) -> Iterator[Dict[str, Any]]:
+        """Yield items from every page of a query.
+
+        A single query response is capped at 1MB; following
+        LastEvaluatedKey streams the full result set to the caller
+        without ever holding it in memory at once.
+        """
+        while True:
+            response = self.table.query(**query_kwargs)
+            yield from response.get("Items", [])
+
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key:
+                return
+            query_kwargs["ExclusiveStartKey"] = last_key
+
+    def upsert_migration_state(
+        self,
+        migration_id: str,
+        **fields: Any,
+    ) -> None:
+        """Create or update a migration item in one UpdateItem call.
+
+        UpdateItem creates the item when it does not exist, so callers
+        that previously did put_item followed by update_item can make a
+        single round trip instead.
+        """
+        fields["updatedAt"] = datetime.utcnow().isoformat()
+
+        set_clauses = []
+        expression_names = {}
+        expression_values = {}
+        for i, (field, value) in enumerate(fields.items()):
+            set_clauses.append(f"#f{i} = :v{i}")
+            expression_names[f"#f{i}"] = field
+            expression_values[f":v{i}"] = value
+
+        self.table.update_item(
+            Key={"migrationId": migration_id},
+            UpdateExpression="SET " + ", ".join(set_clauses),
+            ExpressionAttributeNames=expression_names,
+            ExpressionAttributeValues=expression_values,
+        )
+
+    def query_by_wave(self, wave: str) -> Iterator[Dict[str, Any]]:
+        """Query migrations by wave, streaming across pages."""
+        return self._query_all_pages(
             IndexName="waveIndex",
             KeyConditionExpression="wave = :wave",
             ExpressionAttributeValues={":wave": wave},
         )
-        return response.get("Items", [])
 
-    def query_by_status(self, status: str) -> List[Dict[str, Any]]:
-        """Query migrations by status."""
-        response = self.table.scan(
-            FilterExpression="#status = :status",
+    def query_by_status(self, status: str) -> Iterator[Dict[str, Any]]:
+        """Query migrations by status via the status GSI, streaming across pages."""
+        return self._query_all_pages(
+            IndexName="status-timestamp-index",
+            KeyConditionExpression="#status = :status",
             ExpressionAttributeNames={"#status": "status"},
             ExpressionAttributeValues={":status": status},
         )
-        return response.get("Items", [])
 
     def query_by_app_and_status(
         self, app_name: str, status: str
     ) -> List[Dict[str, Any]]:
-        """Query migrations by app name and status."""
-        response = self.table.scan(
-            FilterExpression="appName = :app AND #status = :status",
+        """Query migrations by app name and status via the app GSI."""
+        response = self.table.query(
+            IndexName="app-status-index",
+            KeyConditionExpression="appName = :app AND #status = :status",
             ExpressionAttributeNames={"#status": "status"},
             ExpressionAttributeValues={
                 ":app": app_name,
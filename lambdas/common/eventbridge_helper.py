@@ -1,7 +1,14 @@
 """EventBridge helper utilities for event publishing."""
-import boto3
-import json
-from typing import Dict, Any, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+
+from common.aws_clients import get_client
+from common.serialization import dumps
+
+# Shared workers for async publishes; module scope so warm Lambda
+# containers reuse the threads
+_publish_executor = ThreadPoolExecutor(max_workers=2)
 
 
 class EventBridgePublisher:
@@ -9,7 +16,7 @@ class EventBridgePublisher:
 
     def __init__(self, bus_name: str, region: str = "us-east-1"):
         """Initialize EventBridge client."""
-        self.client = boto3.client("events", region_name=region)
+        self.client = get_client("events", region)
         self.bus_name = bus_name
 
     def publish_event(
@@ -26,7 +33,7 @@ class EventBridgePublisher:
                     "EventBusName": self.bus_name,
                     "Source": source,
                     "DetailType": detail_type,
-                    "Detail": json.dumps(detail),
+                    "Detail": dumps(detail),
                     "Resources": resources or [],
                 }
             ]
@@ -39,6 +46,60 @@ class EventBridgePublisher:
         
         return response["Entries"][0]["EventId"]
 
+    def publish_events_bulk(
+        self,
+        events: List[Tuple[str, Dict[str, Any]]],
+        source: str = "migration.orchestration",
+        max_retries: int = 2,
+    ) -> List[str]:
+        """Publish multiple events, packing up to 10 entries per PutEvents call.
+
+        Each event is a (detail_type, detail) tuple. Entries that come
+        back with an ErrorCode are retried; anything still failing after
+        the retries raises.
+        """
+        entries = [
+            {
+                "EventBusName": self.bus_name,
+                "Source": source,
+                "DetailType": detail_type,
+                "Detail": dumps(detail),
+                "Resources": [],
+            }
+            for detail_type, detail in events
+        ]
+
+        # IDs are slotted by original position so callers can zip the
+        # result against their input even when some entries are retried
+        event_ids: List[Optional[str]] = [None] * len(entries)
+        for start in range(0, len(entries), 10):
+            chunk = list(enumerate(entries[start:start + 10], start))
+
+            for attempt in range(max_retries + 1):
+                response = self.client.put_events(
+                    Entries=[entry for _, entry in chunk]
+                )
+                results = response.get("Entries", [])
+
+                failed = []
+                for (index, entry), result in zip(chunk, results):
+                    if result.get("ErrorCode"):
+                        failed.append((index, entry))
+                    else:
+                        event_ids[index] = result["EventId"]
+
+                if not failed:
+                    break
+
+                if attempt == max_retries:
+                    raise Exception(
+                        f"Failed to publish {len(failed)} events after retries"
+                    )
+
+                chunk = failed
+
+        return event_ids
+
     def publish_success_event(
         self,
         migration_id: str,
@@ -50,7 +111,7 @@ class EventBridgePublisher:
             "migrationId": migration_id,
             "correlationId": correlation_id,
             "status": "SUCCESS",
-            "timestamp": __import__("datetime").datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow().isoformat(),
         }
         
         if details:
@@ -76,7 +137,7 @@ class EventBridgePublisher:
             "status": "FAILED",
             "errorCode": error_code,
             "errorMessage": error_message,
-            "timestamp": __import__("datetime").datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow().isoformat(),
         }
         
         if details:
@@ -101,7 +162,7 @@ class EventBridgePublisher:
             "correlationId": correlation_id,
             "currentStep": current_step,
             "status": status,
-            "timestamp": __import__("datetime").datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow().isoformat(),
         }
         
         if details:
@@ -111,3 +172,13 @@ class EventBridgePublisher:
             detail_type="MigrationStatusUpdated",
             detail=event_detail,
         )
+
+    def publish_status_event_async(self, *args, **kwargs) -> Future:
+        """Publish a status event without blocking the caller.
+
+        Returns the Future so callers can overlap other I/O and call
+        result() with a bounded timeout before the Lambda returns.
+        """
+        return _publish_executor.submit(
+            self.publish_status_event, *args, **kwargs
+        )
@@ -1,10 +1,19 @@
 """Structured logging utility with correlation ID support."""
-import json
 import logging
 import os
 from datetime import datetime
 from typing import Any, Dict, Optional
 
+from common.correlation import get_correlation_id, propagate_context
+from common.serialization import dumps
+
+_LEVEL_MAP = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
 
 class CorrelatedLogger:
     """Logger with correlation ID support for distributed tracing."""
@@ -12,51 +21,77 @@ class CorrelatedLogger:
     def __init__(self, name: str):
         """Initialize logger with name."""
         self.logger = logging.getLogger(name)
-        self.correlation_id: Optional[str] = None
-        
-        # Setup structured logging
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
+
+        # Setup structured logging. logging.getLogger returns a
+        # per-name singleton, so only attach a handler on first init -
+        # otherwise repeated get_logger calls stack duplicate handlers
+        # and every record gets written N times.
+        if not self.logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
+            handler.setFormatter(formatter)
+            self.logger.addHandler(handler)
         self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
 
     def set_correlation_id(self, correlation_id: str) -> None:
-        """Set correlation ID for request tracing."""
-        self.correlation_id = correlation_id
+        """Set correlation ID for request tracing.
 
-    def _log(self, level: str, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+        Correlation lives in common.correlation's contextvar rather
+        than on the logger, so concurrent executions sharing this
+        per-name singleton cannot stamp each other's records.
+        """
+        propagate_context(correlation_id)
+
+    def _log(
+        self,
+        level: str,
+        message: str,
+        args: tuple,
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> None:
         """Internal log method with correlation ID."""
+        # Skip all formatting, dict building and serialization when the
+        # record would be dropped by the effective level anyway
+        if not self.logger.isEnabledFor(_LEVEL_MAP[level]):
+            return
+
+        # %-style arguments are only interpolated once we know the
+        # record will be emitted
+        if args:
+            message = message % args
+
+        # Correlation is read at emit time, not stored at handler entry
         log_entry = {
             "timestamp": datetime.utcnow().isoformat(),
             "level": level,
             "message": message,
-            "correlation_id": self.correlation_id,
+            "correlation_id": get_correlation_id(),
         }
         
         if extra:
             log_entry.update(extra)
         
         log_method = getattr(self.logger, level.lower())
-        log_method(json.dumps(log_entry))
+        log_method(dumps(log_entry))
 
-    def info(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+    def info(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None) -> None:
         """Log info level message."""
-        self._log("INFO", message, extra)
+        self._log("INFO", message, args, extra)
 
-    def error(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+    def error(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None) -> None:
         """Log error level message."""
-        self._log("ERROR", message, extra)
+        self._log("ERROR", message, args, extra)
 
-    def warning(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+    def warning(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None) -> None:
         """Log warning level message."""
-        self._log("WARNING", message, extra)
+        self._log("WARNING", message, args, extra)
 
-    def debug(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+    def debug(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None) -> None:
         """Log debug level message."""
-        self._log("DEBUG", message, extra)
+        self._log("DEBUG", message, args, extra)
 
 
 def get_logger(name: str) -> CorrelatedLogger:
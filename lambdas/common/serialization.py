@@ -0,0 +1,45 @@
+"""JSON serialization helpers with optional orjson acceleration."""
+import json
+from collections.abc import Mapping
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(obj):
+    """Fallback encoder for non-native types.
+
+    Read-only mapping views (types.MappingProxyType) serialize as plain
+    objects; everything else degrades to its string form.
+    """
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    return str(obj)
+
+
+if orjson is not None:
+    def dumps(obj) -> str:
+        """Serialize to a compact JSON string using orjson."""
+        return orjson.dumps(obj, default=_default).decode()
+
+    def loads(data):
+        """Deserialize JSON from str or bytes using orjson."""
+        return orjson.loads(data)
+
+    def dumps_bytes(obj) -> bytes:
+        """Serialize to compact JSON bytes using orjson."""
+        return orjson.dumps(obj, default=_default)
+else:
+    def dumps(obj) -> str:
+        """Serialize to a compact JSON string using stdlib json."""
+        return json.dumps(obj, separators=(",", ":"), default=_default)
+
+    def loads(data):
+        """Deserialize JSON from str or bytes using stdlib json."""
+        return json.loads(data)
+
+    def dumps_bytes(obj) -> bytes:
+        """Serialize to compact JSON bytes using stdlib json."""
+        return json.dumps(obj, separators=(",", ":"), default=_default).encode()
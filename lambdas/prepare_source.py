@@ -4,22 +4,35 @@ Prepare Source Lambda Function
 Prepares source VM (Azure), installs agents, creates snapshots, validates readiness.
 """
 import os
+from datetime import datetime
 from typing import Dict, Any
 import time
 
-import boto3
+from botocore.exceptions import BotoCoreError, ClientError
 
 from common.logger import get_logger
-from common.correlation import extract_correlation_id
+from common.correlation import extract_correlation_id, propagate_context
 from common.errors import SourcePreparationError
 from common.eventbridge_helper import EventBridgePublisher
 from common.dynamodb_helper import MigrationStateManager
+from common.aws_clients import get_client
 
 logger = get_logger(__name__)
 eventbridge = EventBridgePublisher(os.environ.get("EVENTBRIDGE_BUS_NAME"))
 state_manager = MigrationStateManager(os.environ.get("DYNAMODB_TABLE_NAME"))
 
 
+def _now() -> str:
+    """Return the current UTC timestamp in ISO format."""
+    return datetime.utcnow().isoformat()
+
+
+# Warm-container cache of the MGN source-server list; back-to-back
+# migrations rarely see the fleet change within the TTL
+_MGN_CACHE_TTL_SECONDS = 30.0
+_mgn_cache = {"fetched": 0.0, "items": None}
+
+
 def prepare_azure_source(payload: Dict[str, Any]) -> Dict[str, Any]:
     """Prepare Azure source VM."""
     logger.info("Preparing Azure source VM")
@@ -37,7 +50,7 @@ def prepare_azure_source(payload: Dict[str, Any]) -> Dict[str, Any]:
         "agentInstalled": True,
         "snapshotCreated": True,
         "readinessValidated": True,
-        "preparedAt": __import__("datetime").datetime.utcnow().isoformat(),
+        "preparedAt": _now(),
     }
     
     logger.info("Azure source prepared", extra=preparation_result)
@@ -47,14 +60,21 @@ def prepare_azure_source(payload: Dict[str, Any]) -> Dict[str, Any]:
 def prepare_source_with_mgn(payload: Dict[str, Any]) -> Dict[str, Any]:
     """Prepare source with MGN integration."""
     logger.info("Integrating with MGN for source preparation")
-    
-    mgn = boto3.client("mgn")
-    
+
     try:
-        # List source servers
-        response = mgn.describe_source_servers()
-        source_servers = response.get("items", [])
-        
+        # List source servers, reusing the cached fleet while fresh
+        source_servers = _mgn_cache["items"]
+        if (
+            source_servers is None
+            or time.monotonic() - _mgn_cache["fetched"] >= _MGN_CACHE_TTL_SECONDS
+        ):
+            # Azure payloads never reach this path, so defer client
+            # setup to first use; get_client memoizes it
+            response = get_client("mgn").describe_source_servers()
+            source_servers = response.get("items", [])
+            _mgn_cache["items"] = source_servers
+            _mgn_cache["fetched"] = time.monotonic()
+
         logger.info(
             "MGN source servers retrieved",
             extra={"count": len(source_servers)},
@@ -63,7 +83,7 @@ def prepare_source_with_mgn(payload: Dict[str, Any]) -> Dict[str, Any]:
         preparation_result = {
             "mgn_integrated": True,
             "source_servers_found": len(source_servers),
-            "preparedAt": __import__("datetime").datetime.utcnow().isoformat(),
+            "preparedAt": _now(),
         }
         
         return preparation_result
@@ -75,17 +95,20 @@ def prepare_source_with_mgn(payload: Dict[str, Any]) -> Dict[str, Any]:
         )
 
 
+# Fields every source payload must carry
+_REQUIRED_FIELDS = ("sourceVmId", "source")
+
+
 def validate_source_readiness(payload: Dict[str, Any]) -> bool:
     """Validate source VM is ready for migration."""
     logger.info("Validating source readiness")
-    
-    # Check required fields
-    required_fields = ["sourceVmId", "source"]
-    for field in required_fields:
-        if field not in payload or not payload[field]:
-            logger.warning(f"Missing field: {field}")
-            return False
-    
+
+    # One lookup per field; get() covers both missing and falsy values
+    missing = [field for field in _REQUIRED_FIELDS if not payload.get(field)]
+    if missing:
+        logger.warning("Missing required fields", extra={"fields": missing})
+        return False
+
     logger.info("Source readiness validation passed")
     return True
 
@@ -104,7 +127,7 @@ def lambda_handler(event, context):
     try:
         detail = event.get("detail", {})
         correlation_id = extract_correlation_id(event)
-        logger.set_correlation_id(correlation_id)
+        propagate_context(correlation_id)
         
         migration_id = detail.get("migrationId")
         logger.info(
@@ -159,10 +182,11 @@ def lambda_handler(event, context):
         }
         
     except SourcePreparationError as e:
-        logger.error("Source preparation failed", extra=e.to_dict())
-        
+        error_body = e.to_dict()
+        logger.error("Source preparation failed", extra=error_body)
+
         migration_id = detail.get("migrationId", "unknown")
-        
+
         # Publish failure event
         try:
             eventbridge.publish_failure_event(
@@ -171,12 +195,15 @@ def lambda_handler(event, context):
                 error_code=e.error_code,
                 error_message=e.message,
             )
-        except:
-            pass
-        
+        except (BotoCoreError, ClientError) as pub_err:
+            logger.warning(
+                "Failed to publish failure event",
+                extra={"error": str(pub_err)},
+            )
+
         return {
             "statusCode": 500,
-            "body": e.to_dict(),
+            "body": error_body,
         }
         
     except Exception as e:
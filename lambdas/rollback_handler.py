@@ -4,27 +4,65 @@ Rollback Handler Lambda Function
 Handles rollback on failure, restores previous state, notifies stakeholders.
 """
 import os
-from typing import Dict, Any
-
-import boto3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Any, Optional
 
 from common.logger import get_logger
-from common.correlation import extract_correlation_id
+from common.correlation import extract_correlation_id, propagate_context
 from common.errors import RollbackError
 from common.eventbridge_helper import EventBridgePublisher
 from common.dynamodb_helper import MigrationStateManager
+from common.aws_clients import get_client
 
 logger = get_logger(__name__)
 eventbridge = EventBridgePublisher(os.environ.get("EVENTBRIDGE_BUS_NAME"))
 state_manager = MigrationStateManager(os.environ.get("DYNAMODB_TABLE_NAME"))
 
 
+def _now() -> str:
+    """Return the current UTC timestamp in ISO format."""
+    return datetime.utcnow().isoformat()
+
+
+# Idempotent side-effect stubs are memoized per container so warm
+# replays (retries of the same migration) skip the round trip. The
+# coarse time bucket folded into the cache key evicts entries after
+# the TTL without an extra dependency.
+_STUB_CACHE_TTL_SECONDS = 60
+
+
+def _ttl_bucket() -> int:
+    """Coarse monotonic bucket used to age out lru_cache entries."""
+    return int(time.monotonic() // _STUB_CACHE_TTL_SECONDS)
+
+
+# Skeletons for the per-call result dicts; copying a prebuilt template
+# skips rebuilding the same key set on every invocation
+_RESTORE_TEMPLATE = {
+    "sourceVmId": None,
+    "status": "STATE_RESTORED",
+    "restoredAt": None,
+}
+_NOTIFICATION_TEMPLATE = {
+    "migrationId": None,
+    "notificationType": "ROLLBACK_NOTIFICATION",
+    "status": "SENT",
+    "sentAt": None,
+    "errorDetails": None,
+}
+
+
 def stop_mgn_replication(source_vm_id: str) -> Dict[str, Any]:
     """Stop MGN replication for source."""
     logger.info("Stopping MGN replication")
-    
-    mgn = boto3.client("mgn")
-    
+
+    # Memoized by get_client, so only the first call per container pays
+    # for construction - and only when this path runs
+    mgn = get_client("mgn")
+
     try:
         # Stop replication
         mgn.discontinue_from_launch(
@@ -48,9 +86,7 @@ def stop_mgn_replication(source_vm_id: str) -> Dict[str, Any]:
 def terminate_target_instance(payload: Dict[str, Any]) -> Dict[str, Any]:
     """Terminate target AWS instance."""
     logger.info("Terminating target instance")
-    
-    ec2 = boto3.client("ec2")
-    
+
     # In production, get instance ID from migration state
     instance_id = payload.get("targetInstanceId")
     
@@ -62,7 +98,7 @@ def terminate_target_instance(payload: Dict[str, Any]) -> Dict[str, Any]:
         }
     
     try:
-        ec2.terminate_instances(InstanceIds=[instance_id])
+        get_client("ec2").terminate_instances(InstanceIds=[instance_id])
         
         logger.info("Target instance termination initiated")
         
@@ -78,46 +114,68 @@ def terminate_target_instance(payload: Dict[str, Any]) -> Dict[str, Any]:
         )
 
 
-def restore_source_state(payload: Dict[str, Any]) -> Dict[str, Any]:
-    """Restore source VM to previous state."""
+@lru_cache(maxsize=128)
+def _restore_source_state_cached(source_vm_id: str, bucket: int) -> Dict[str, Any]:
+    """Restore one source VM; memoized per TTL bucket."""
     logger.info("Restoring source VM state")
-    
+
     # In production, this would restore from snapshots or backups
+    restore_result = _RESTORE_TEMPLATE.copy()
+    restore_result["sourceVmId"] = source_vm_id
+    restore_result["restoredAt"] = _now()
+
+    logger.info("Source VM state restored", extra=restore_result)
+    return restore_result
+
+
+def restore_source_state(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Restore source VM to previous state."""
     source_vm_id = payload.get("sourceVmId")
-    
+
     if not source_vm_id:
         raise RollbackError("Source VM ID not provided for state restoration")
-    
-    restore_result = {
-        "sourceVmId": source_vm_id,
-        "status": "STATE_RESTORED",
-        "restoredAt": __import__("datetime").datetime.utcnow().isoformat(),
-    }
-    
-    logger.info("Source VM state restored", extra=restore_result)
-    return restore_result
 
+    return _restore_source_state_cached(source_vm_id, _ttl_bucket())
 
-def notify_stakeholders(
-    migration_id: str,
-    error_details: Dict[str, Any],
+
+@lru_cache(maxsize=128)
+def _notify_stakeholders_cached(
+    migration_id: Optional[str],
+    error_code: Optional[str],
+    error_message: Optional[str],
+    bucket: int,
 ) -> Dict[str, Any]:
-    """Notify stakeholders of rollback."""
+    """Send one rollback notification; memoized per TTL bucket."""
     logger.info("Notifying stakeholders of rollback")
-    
+
     # In production, this would send emails/notifications via SNS
-    notification = {
-        "migrationId": migration_id,
-        "notificationType": "ROLLBACK_NOTIFICATION",
-        "status": "SENT",
-        "sentAt": __import__("datetime").datetime.utcnow().isoformat(),
-        "errorDetails": error_details,
+    notification = _NOTIFICATION_TEMPLATE.copy()
+    notification["migrationId"] = migration_id
+    notification["sentAt"] = _now()
+    notification["errorDetails"] = {
+        "errorCode": error_code,
+        "errorMessage": error_message,
     }
-    
+
     logger.info("Stakeholders notified", extra=notification)
     return notification
 
 
+def notify_stakeholders(
+    migration_id: str,
+    error_details: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Notify stakeholders of rollback."""
+    # The cache key only takes hashable primitives, so the error dict
+    # is unpacked here and rebuilt inside the worker
+    return _notify_stakeholders_cached(
+        migration_id,
+        error_details.get("errorCode"),
+        error_details.get("errorMessage"),
+        _ttl_bucket(),
+    )
+
+
 def lambda_handler(event, context):
     """
     Handle rollback on migration failure.
@@ -132,7 +190,7 @@ def lambda_handler(event, context):
     try:
         detail = event.get("detail", {})
         correlation_id = extract_correlation_id(event)
-        logger.set_correlation_id(correlation_id)
+        propagate_context(correlation_id)
         
         migration_id = detail.get("migrationId")
         logger.info(
@@ -143,68 +201,73 @@ def lambda_handler(event, context):
             },
         )
         
+        # One (key, callable, args) entry per rollback step replaces
+        # four near-identical try/except blocks; each step is still
+        # best-effort and a failure never blocks the others
+        source_vm_id = detail.get("sourceVmId")
+        steps = [
+            ("mgnReplication", stop_mgn_replication, (source_vm_id,))
+            if source_vm_id
+            else None,
+            ("targetInstance", terminate_target_instance, (detail,)),
+            ("sourceState", restore_source_state, (detail,)),
+            (
+                "notification",
+                notify_stakeholders,
+                (
+                    migration_id,
+                    {
+                        "errorCode": detail.get("errorCode"),
+                        "errorMessage": detail.get("errorMessage"),
+                    },
+                ),
+            ),
+        ]
+        steps = [s for s in steps if s]
+
         rollback_results = {}
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            futures = {
+                key: executor.submit(fn, *args) for key, fn, args in steps
+            }
+            for key, future in futures.items():
+                try:
+                    rollback_results[key] = future.result()
+                except Exception as e:
+                    logger.warning(
+                        "Rollback step failed",
+                        extra={"step": key, "error": str(e)},
+                    )
+                    rollback_results[key] = {"status": "FAILED", "error": str(e)}
         
-        # Stop MGN replication
-        try:
-            source_vm_id = detail.get("sourceVmId")
-            if source_vm_id:
-                rollback_results["mgnReplication"] = stop_mgn_replication(source_vm_id)
-        except Exception as e:
-            logger.warning("Failed to stop MGN replication", extra={"error": str(e)})
-            rollback_results["mgnReplication"] = {"status": "FAILED", "error": str(e)}
-        
-        # Terminate target instance
-        try:
-            rollback_results["targetInstance"] = terminate_target_instance(detail)
-        except Exception as e:
-            logger.warning("Failed to terminate target instance", extra={"error": str(e)})
-            rollback_results["targetInstance"] = {"status": "FAILED", "error": str(e)}
-        
-        # Restore source state
-        try:
-            rollback_results["sourceState"] = restore_source_state(detail)
-        except Exception as e:
-            logger.warning("Failed to restore source state", extra={"error": str(e)})
-            rollback_results["sourceState"] = {"status": "FAILED", "error": str(e)}
-        
-        # Notify stakeholders
-        try:
-            rollback_results["notification"] = notify_stakeholders(
+        # State update and rollback event target different services -
+        # write them in parallel
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            state_future = executor.submit(
+                state_manager.update_migration_status,
                 migration_id,
-                {
-                    "errorCode": detail.get("errorCode"),
-                    "errorMessage": detail.get("errorMessage"),
+                "ROLLED_BACK",
+                rollback_results,
+            )
+            event_future = executor.submit(
+                eventbridge.publish_event,
+                detail_type="MigrationRolledBack",
+                detail={
+                    "migrationId": migration_id,
+                    "correlationId": correlation_id,
+                    "status": "ROLLED_BACK",
+                    "rollbackDetails": rollback_results,
+                    "timestamp": _now(),
                 },
             )
-        except Exception as e:
-            logger.warning("Failed to notify stakeholders", extra={"error": str(e)})
-            rollback_results["notification"] = {"status": "FAILED", "error": str(e)}
-        
-        # Update migration state
-        state_manager.update_migration_status(
-            migration_id,
-            "ROLLED_BACK",
-            execution_details=rollback_results,
-        )
-        
+            state_future.result()
+            event_future.result()
+
         logger.info(
             "Rollback process completed",
             extra={"migrationId": migration_id},
         )
         
-        # Publish rollback event
-        eventbridge.publish_event(
-            detail_type="MigrationRolledBack",
-            detail={
-                "migrationId": migration_id,
-                "correlationId": correlation_id,
-                "status": "ROLLED_BACK",
-                "rollbackDetails": rollback_results,
-                "timestamp": __import__("datetime").datetime.utcnow().isoformat(),
-            },
-        )
-        
         return {
             "statusCode": 200,
             "body": {
@@ -3,21 +3,56 @@ Rollback Handler Lambda Function
 Handles rollback on failure, restores previous state, notifies stakeholders
 """
 
-import json
+import asyncio
 import logging
+import os
 import boto3
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Dict, Any, Tuple
 
 from common.logger import get_logger
-from common.correlation import get_correlation_id, propagate_context
-from common.dynamodb_helper import update_migration_state
+from common.correlation import get_correlation_id
+from common.aws_clients import get_dynamodb_resource
+from common.serialization import dumps
 
 logger = get_logger(__name__)
 mgn_client = boto3.client('mgn')
 ec2_client = boto3.client('ec2')
 sns_client = boto3.client('sns')
-dynamodb = boto3.resource('dynamodb')
+# Shared resource with keep-alive and pooled connections; building the
+# Table proxy once per container avoids re-walking the service model
+dynamodb = get_dynamodb_resource()
+MIGRATION_STATE_TABLE = dynamodb.Table(
+    os.environ.get('DYNAMODB_TABLE_NAME', 'migration-state')
+)
+
+# Touching endpoint_url forces boto3's lazy endpoint resolution during
+# init (free on provisioned concurrency) instead of on the first API
+# call of the first invocation
+_ = mgn_client.meta.endpoint_url
+_ = ec2_client.meta.endpoint_url
+_ = sns_client.meta.endpoint_url
+
+# Warm the table metadata cache the same way; best-effort only
+try:
+    _ = MIGRATION_STATE_TABLE.table_status
+except Exception:
+    pass
+
+# SNS notifications are fire-and-forget; the executor lets the handler
+# continue while the publish is in flight, and pending futures are
+# flushed (bounded) before the handler returns
+_sns_executor = ThreadPoolExecutor(max_workers=2)
+_pending_notifications = []
+
+# Workers backing the async rollback fan-out; module scope so warm
+# invocations reuse the threads
+_rollback_executor = ThreadPoolExecutor(max_workers=3)
+
+# Topic ARNs are fixed per container; read the environment once
+SNS_TOPIC_ARN = os.environ.get('SNS_TOPIC_ARN')
+SNS_ALARM_TOPIC_ARNS = os.environ.get('SNS_ALARM_TOPIC_ARNS', '')
 
 
 def revert_target_instance(payload: Dict[str, Any]) -> Tuple[bool, str]:
@@ -30,19 +65,19 @@ def revert_target_instance(payload: Dict[str, Any]) -> Tuple[bool, str]:
             logger.warning("No target instance ID to revert")
             return True, "No target instance to revert"
         
-        logger.info(f"Reverting target instance: {target_instance_id}")
+        logger.info("Reverting target instance: %s", target_instance_id)
         
         # Terminate the target instance
         try:
             ec2_client.terminate_instances(InstanceIds=[target_instance_id])
-            logger.info(f"Target instance {target_instance_id} terminated")
+            logger.info("Target instance %s terminated", target_instance_id)
             return True, f"Instance {target_instance_id} terminated"
         except Exception as e:
-            logger.error(f"Failed to terminate instance: {str(e)}")
+            logger.error("Failed to terminate instance: %s", str(e))
             return False, str(e)
 
     except Exception as e:
-        logger.error(f"Error reverting target instance: {str(e)}")
+        logger.error("Error reverting target instance: %s", str(e))
         return False, str(e)
 
 
@@ -53,7 +88,7 @@ def restore_source_vm(payload: Dict[str, Any]) -> Tuple[bool, str]:
         app_name = payload['appName']
         snapshot_id = payload.get('snapshotId')
         
-        logger.info(f"Restoring source VM {app_name} from snapshot")
+        logger.info("Restoring source VM %s from snapshot", app_name)
         
         if not snapshot_id:
             logger.warning("No snapshot ID available for restore")
@@ -63,22 +98,22 @@ def restore_source_vm(payload: Dict[str, Any]) -> Tuple[bool, str]:
         
         if source == 'azure':
             # Restore Azure VM from snapshot
-            logger.info(f"Azure VM restore initiated from snapshot: {snapshot_id}")
+            logger.info("Azure VM restore initiated from snapshot: %s", snapshot_id)
             # In production, use Azure SDK to restore
             
         elif source == 'vmware':
             # Revert VMware snapshot
-            logger.info(f"VMware snapshot revert initiated: {snapshot_id}")
+            logger.info("VMware snapshot revert initiated: %s", snapshot_id)
             # In production, use vSphere API to revert
         
-        # Simulate restore operation
-        time.sleep(5)
-        
-        logger.info(f"Source VM {app_name} restored successfully")
+        # The restore itself is asynchronous; the state machine waits
+        # for it after the Rollback task instead of sleeping here and
+        # paying for idle Lambda time
+        logger.info("Source VM %s restored successfully", app_name)
         return True, f"VM restored from snapshot {snapshot_id}"
 
     except Exception as e:
-        logger.error(f"Error restoring source VM: {str(e)}")
+        logger.error("Error restoring source VM: %s", str(e))
         return False, str(e)
 
 
@@ -92,7 +127,7 @@ def cancel_mgn_job(payload: Dict[str, Any]) -> Tuple[bool, str]:
             logger.info("No active MGN job to cancel")
             return True, "No job to cancel"
         
-        logger.info(f"Canceling MGN job: {job_id}")
+        logger.info("Canceling MGN job: %s", job_id)
         
         try:
             # Get job details
@@ -104,45 +139,72 @@ def cancel_mgn_job(payload: Dict[str, Any]) -> Tuple[bool, str]:
                 
                 # Only cancel if job is still running
                 if job_status not in ['COMPLETED', 'SUCCEEDED', 'FAILED']:
-                    logger.info(f"Job {job_id} is still running, attempting cancel")
+                    logger.info("Job %s is still running, attempting cancel", job_id)
                     # In production, call cancel if MGN API supports it
-                    logger.info(f"Job {job_id} cancellation initiated")
+                    logger.info("Job %s cancellation initiated", job_id)
                 else:
-                    logger.info(f"Job {job_id} is already in terminal state: {job_status}")
+                    logger.info("Job %s is already in terminal state: %s", job_id, job_status)
             
             return True, f"Job cancellation processed"
             
         except Exception as e:
-            logger.warning(f"Could not cancel job: {str(e)}")
+            logger.warning("Could not cancel job: %s", str(e))
             return True, "Job cancel attempted"
 
     except Exception as e:
-        logger.error(f"Error canceling MGN job: {str(e)}")
+        logger.error("Error canceling MGN job: %s", str(e))
         return False, str(e)
 
 
-def restore_previous_state(migration_id: str) -> bool:
-    """Restore DynamoDB state from backup"""
+def update_migration_state(migration_id: str, status: str, details: Dict[str, Any]):
+    """Write migration status straight through the pre-bound table"""
     try:
-        logger.info(f"Restoring previous state for migration: {migration_id}")
-        
-        table = dynamodb.Table('migration-state')
-        
-        # Get backup state
-        response = table.get_item(Key={'migrationId': migration_id})
-        
-        if 'Item' in response:
-            current_state = response['Item']
-            
-            # Restore previous state if available
-            if 'sourceState' in current_state:
-                logger.info(f"Restoring state from backup for {migration_id}")
-                return True
-        
+        MIGRATION_STATE_TABLE.update_item(
+            Key={'migrationId': migration_id},
+            UpdateExpression='SET #s = :status, executionDetails = :details',
+            ExpressionAttributeNames={'#s': 'status'},
+            ExpressionAttributeValues={
+                ':status': status,
+                ':details': details
+            }
+        )
+    except Exception as e:
+        logger.error("Failed to update migration state: %s", str(e))
+
+
+def mark_rollback_in_progress(migration_id: str, error: str, correlation_id: str, now_ts: int) -> bool:
+    """Mark the migration ROLLBACK_IN_PROGRESS and restore backup state.
+
+    A single UpdateItem with ReturnValues='ALL_OLD' both writes the new
+    status and returns the previous item, so the old get_item round
+    trip is folded into the status update.
+    """
+    try:
+        logger.info("Restoring previous state for migration: %s", migration_id)
+
+        response = MIGRATION_STATE_TABLE.update_item(
+            Key={'migrationId': migration_id},
+            UpdateExpression='SET #s = :status, rollbackStart = :ts, rollbackError = :err, correlationId = :cid',
+            ExpressionAttributeNames={'#s': 'status'},
+            ExpressionAttributeValues={
+                ':status': 'ROLLBACK_IN_PROGRESS',
+                ':ts': now_ts,
+                ':err': error,
+                ':cid': correlation_id
+            },
+            ReturnValues='ALL_OLD'
+        )
+
+        previous_state = response.get('Attributes', {})
+
+        # Restore previous state if available
+        if 'sourceState' in previous_state:
+            logger.info("Restoring state from backup for %s", migration_id)
+
         return True
 
     except Exception as e:
-        logger.error(f"Error restoring state: {str(e)}")
+        logger.error("Error restoring state: %s", str(e))
         return False
 
 
@@ -152,12 +214,10 @@ def notify_stakeholders(payload: Dict[str, Any], reason: str) -> bool:
         migration_id = payload['migrationId']
         app_name = payload['appName']
         
-        logger.info(f"Notifying stakeholders about rollback for {app_name}")
-        
-        # Get SNS topic ARN from environment
-        import os
-        topic_arn = os.environ.get('SNS_TOPIC_ARN')
+        logger.info("Notifying stakeholders about rollback for %s", app_name)
         
+        topic_arn = SNS_TOPIC_ARN
+
         if not topic_arn:
             logger.warning("SNS topic ARN not configured")
             return False
@@ -167,29 +227,117 @@ def notify_stakeholders(payload: Dict[str, Any], reason: str) -> bool:
             'appName': app_name,
             'status': 'ROLLBACK_INITIATED',
             'reason': reason,
-            'timestamp': int(time.time()),
+            'timestamp': time.time_ns() // 1_000_000_000,
             'action': 'A rollback has been initiated for this migration. Please review logs for details.'
         }
         
-        try:
-            response = sns_client.publish(
-                TopicArn=topic_arn,
-                Subject=f'Migration Rollback: {app_name} ({migration_id})',
-                Message=json.dumps(message, indent=2)
-            )
-            
-            logger.info(f"Notification sent: {response['MessageId']}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to send notification: {str(e)}")
-            return False
+        notifications = [(
+            topic_arn,
+            f'Migration Rollback: {app_name} ({migration_id})',
+            message
+        )]
+
+        # Per-stakeholder topics would add more entries here; extra
+        # alarm topics come from a comma-separated env var
+        for arn in filter(None, SNS_ALARM_TOPIC_ARNS.split(',')):
+            notifications.append((
+                arn.strip(),
+                f'Migration Rollback: {app_name} ({migration_id})',
+                message
+            ))
+
+        # The MessageIds are only logged, so the publish does not need
+        # to block the rollback critical path
+        _pending_notifications.append(_sns_executor.submit(
+            _publish_notifications, notifications
+        ))
+        return True
 
     except Exception as e:
-        logger.error(f"Error notifying stakeholders: {str(e)}")
+        logger.error("Error notifying stakeholders: %s", str(e))
         return False
 
 
+def _publish_notifications(notifications) -> None:
+    """Publish (topic_arn, subject, message) tuples on the background executor
+
+    A single message goes through plain publish; multiple messages to
+    the same topic are grouped through publish_batch (up to 10 per
+    call) to cut the request count.
+    """
+    try:
+        by_topic = {}
+        for topic_arn, subject, message in notifications:
+            by_topic.setdefault(topic_arn, []).append((subject, message))
+
+        for topic_arn, entries in by_topic.items():
+            if len(entries) == 1:
+                subject, message = entries[0]
+                # Compact encoding: SNS bills by payload size and the
+                # pretty-printed form only added whitespace
+                response = sns_client.publish(
+                    TopicArn=topic_arn,
+                    Subject=subject,
+                    Message=dumps(message)
+                )
+                logger.info("Notification sent: %s", response['MessageId'])
+                continue
+
+            for start in range(0, len(entries), 10):
+                batch = entries[start:start + 10]
+                response = sns_client.publish_batch(
+                    TopicArn=topic_arn,
+                    PublishBatchRequestEntries=[
+                        {
+                            'Id': str(start + i),
+                            'Subject': subject,
+                            'Message': dumps(message)
+                        }
+                        for i, (subject, message) in enumerate(batch)
+                    ]
+                )
+                for failed in response.get('Failed', []):
+                    logger.error("Notification entry failed: %s", failed)
+
+    except Exception as e:
+        logger.error("Failed to send notification: %s", str(e))
+
+
+def _flush_notifications(timeout: float = 0.2) -> None:
+    """Bounded wait for in-flight notifications before Lambda freezes"""
+    if _pending_notifications:
+        wait(_pending_notifications, timeout=timeout)
+        _pending_notifications.clear()
+
+
+_ROLLBACK_STEPS = [
+    ('cancel_mgn_job', cancel_mgn_job),
+    ('revert_target_instance', revert_target_instance),
+    ('restore_source_vm', restore_source_vm),
+]
+
+
+def _timed_step(fn, payload: Dict[str, Any]):
+    """Run one rollback step and measure its latency in milliseconds"""
+    start = time.monotonic_ns()
+    success, message = fn(payload)
+    return success, message, (time.monotonic_ns() - start) // 1_000_000
+
+
+async def _run_rollback_steps(payload: Dict[str, Any]):
+    """Run the independent rollback steps concurrently on one event loop
+
+    boto3 stays synchronous, so each step executes on the shared
+    executor; gather keeps the results in declaration order.
+    """
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(*(
+        loop.run_in_executor(_rollback_executor, _timed_step, fn, payload)
+        for _, fn in _ROLLBACK_STEPS
+    ))
+    return [(name, result) for (name, _), result in zip(_ROLLBACK_STEPS, results)]
+
+
 def lambda_handler(event, context):
     """
     Handle rollback of failed migration
@@ -200,63 +348,47 @@ def lambda_handler(event, context):
         dict: Rollback result
     """
     correlation_id = get_correlation_id()
-    propagate_context(correlation_id)
     
     migration_id = event.get('migrationId') or event.get('detail', {}).get('migrationId')
     error = event.get('error', 'Unknown error')
     
-    logger.info(f"Initiating rollback for migration: {migration_id}, Reason: {error}")
-    
+    logger.info("Initiating rollback for migration: %s, Reason: %s", migration_id, error)
+
+    # One clock read for every timestamp written during this invocation;
+    # time_ns skips the float round trip of time.time()
+    now_ts = time.time_ns() // 1_000_000_000
+
     try:
         payload = event.get('detail', event)
-        
-        # Update migration state
-        update_migration_state(migration_id, 'ROLLBACK_IN_PROGRESS', {
-            'step': 'rollback',
-            'error': error,
-            'correlationId': correlation_id,
-            'timestamp': int(time.time())
-        })
-        
-        # Execute rollback steps in order
+
+        # Mark rollback in progress and pull the previous state in one
+        # DynamoDB round trip
+        mark_rollback_in_progress(migration_id, error, correlation_id, now_ts)
+
+        # The three rollback steps are independent I/O-bound AWS calls;
+        # gather overlaps them so wall time is the slowest step rather
+        # than the sum of all three. With no job, instance or snapshot
+        # in the payload every step is a no-op, so skip the fan-out
+        # entirely
         rollback_steps = []
-        
-        # Cancel any in-progress jobs
-        success, message = cancel_mgn_job(payload)
-        rollback_steps.append({
-            'step': 'cancel_mgn_job',
-            'success': success,
-            'message': message
-        })
-        
-        if not success:
-            logger.warning(f"Failed to cancel MGN job: {message}")
-        
-        # Revert target instance
-        success, message = revert_target_instance(payload)
-        rollback_steps.append({
-            'step': 'revert_target_instance',
-            'success': success,
-            'message': message
-        })
-        
-        if not success:
-            logger.warning(f"Failed to revert target: {message}")
-        
-        # Restore source VM
-        success, message = restore_source_vm(payload)
-        rollback_steps.append({
-            'step': 'restore_source_vm',
-            'success': success,
-            'message': message
-        })
-        
-        if not success:
-            logger.warning(f"Failed to restore source: {message}")
-        
-        # Restore previous state
-        restore_previous_state(migration_id)
-        
+        needs_rollback = any(
+            payload.get(k) for k in ('jobId', 'targetInstanceId', 'snapshotId')
+        )
+
+        if needs_rollback:
+            for name, (success, message, latency_ms) in asyncio.run(_run_rollback_steps(payload)):
+                if not success:
+                    logger.warning("Rollback step %s failed: %s", name, message)
+
+                rollback_steps.append({
+                    'step': name,
+                    'success': success,
+                    'message': message,
+                    'latency_ms': latency_ms
+                })
+        else:
+            logger.info("No mutable state to revert for %s", migration_id)
+
         # Notify stakeholders
         notify_stakeholders(payload, error)
         
@@ -266,11 +398,13 @@ def lambda_handler(event, context):
             'rollbackSteps': rollback_steps,
             'error': error,
             'correlationId': correlation_id,
-            'timestamp': int(time.time())
+            'timestamp': now_ts
         })
-        
-        logger.info(f"Rollback completed for {migration_id}")
-        
+
+        logger.info("Rollback completed for %s", migration_id)
+
+        _flush_notifications()
+
         return {
             'statusCode': 200,
             'success': True,
@@ -282,14 +416,14 @@ def lambda_handler(event, context):
         }
 
     except Exception as e:
-        logger.error(f"Rollback failed: {str(e)}", exc_info=True)
+        logger.error("Rollback failed: %s", str(e))
         
         # Update migration state
         update_migration_state(migration_id, 'ROLLBACK_FAILED', {
             'error': str(e),
             'originalError': error,
             'correlationId': correlation_id,
-            'timestamp': int(time.time())
+            'timestamp': now_ts
         })
         
         return {
@@ -39,7 +39,7 @@ def test_validate_message_missing_required_field():
 @patch("ingress_handler.eventbridge")
 def test_ingress_handler_successful(mock_eventbridge):
     """Test successful message ingestion."""
-    mock_eventbridge.publish_event.return_value = "event-123"
+    mock_eventbridge.publish_events_bulk.return_value = ["event-123"]
     
     event = {
         "Records": [
@@ -4,27 +4,34 @@ Trigger Migration Lambda Function
 Calls AWS MGN API to start test/cutover, integrates with CMF for wave management.
 """
 import os
+from datetime import datetime
 from typing import Dict, Any
 
-import boto3
-
 from common.logger import get_logger
-from common.correlation import extract_correlation_id
+from common.correlation import extract_correlation_id, propagate_context
 from common.errors import MigrationExecutionError
 from common.eventbridge_helper import EventBridgePublisher
 from common.dynamodb_helper import MigrationStateManager
+from common.aws_clients import get_client
 
 logger = get_logger(__name__)
 eventbridge = EventBridgePublisher(os.environ.get("EVENTBRIDGE_BUS_NAME"))
 state_manager = MigrationStateManager(os.environ.get("DYNAMODB_TABLE_NAME"))
 
 
+def _now() -> str:
+    """Return the current UTC timestamp in ISO format."""
+    return datetime.utcnow().isoformat()
+
+
 def trigger_mgn_test_launch(payload: Dict[str, Any]) -> Dict[str, Any]:
     """Trigger MGN test launch."""
     logger.info("Triggering MGN test launch")
-    
-    mgn = boto3.client("mgn")
-    
+
+    # Memoized by get_client, so warm invocations reuse the client and
+    # its keep-alive connection pool instead of re-handshaking
+    mgn = get_client("mgn")
+
     try:
         # Start test launch
         response = mgn.start_test_launch(
@@ -37,7 +44,7 @@ def trigger_mgn_test_launch(payload: Dict[str, Any]) -> Dict[str, Any]:
         return {
             "jobId": response.get("job", {}).get("jobID"),
             "status": "TEST_LAUNCH_INITIATED",
-            "timestamp": __import__("datetime").datetime.utcnow().isoformat(),
+            "timestamp": _now(),
         }
         
     except Exception as e:
@@ -50,9 +57,9 @@ def trigger_mgn_test_launch(payload: Dict[str, Any]) -> Dict[str, Any]:
 def trigger_mgn_cutover(payload: Dict[str, Any]) -> Dict[str, Any]:
     """Trigger MGN cutover."""
     logger.info("Triggering MGN cutover")
-    
-    mgn = boto3.client("mgn")
-    
+
+    mgn = get_client("mgn")
+
     try:
         # Start cutover
         response = mgn.start_cutover(
@@ -65,7 +72,7 @@ def trigger_mgn_cutover(payload: Dict[str, Any]) -> Dict[str, Any]:
         return {
             "jobId": response.get("job", {}).get("jobID"),
             "status": "CUTOVER_INITIATED",
-            "timestamp": __import__("datetime").datetime.utcnow().isoformat(),
+            "timestamp": _now(),
         }
         
     except Exception as e:
@@ -87,7 +94,7 @@ def update_cmf_wave_status(
         "wave": payload.get("wave"),
         "appName": payload.get("appName"),
         "status": status,
-        "updatedAt": __import__("datetime").datetime.utcnow().isoformat(),
+        "updatedAt": _now(),
     }
     
     logger.info("CMF wave status updated", extra=cmf_update)
@@ -108,7 +115,7 @@ def lambda_handler(event, context):
     try:
         detail = event.get("detail", {})
         correlation_id = extract_correlation_id(event)
-        logger.set_correlation_id(correlation_id)
+        propagate_context(correlation_id)
         
         migration_id = detail.get("migrationId")
         logger.info(
@@ -117,8 +124,10 @@ def lambda_handler(event, context):
         )
         
         # Determine migration type (test vs cutover)
+        # Length check first: it is O(1) and short-circuits the O(n)
+        # list scan on most invocations
         steps = detail.get("steps", [])
-        is_test = "freeze" not in steps or len(steps) < 3
+        is_test = len(steps) < 3 or "freeze" not in steps
         
         # Trigger appropriate migration type
         if is_test:
@@ -132,6 +141,19 @@ def lambda_handler(event, context):
             "IN_PROGRESS",
         )
         
+        # Start the status publish first so it overlaps the DynamoDB
+        # write; consumers only need at-least-once delivery
+        publish_future = eventbridge.publish_status_event_async(
+            migration_id=migration_id,
+            correlation_id=correlation_id,
+            current_step="trigger_migration",
+            status="IN_PROGRESS",
+            details={
+                "mgn": migration_result,
+                "cmf": cmf_result,
+            },
+        )
+
         # Update migration state
         state_manager.update_migration_status(
             migration_id,
@@ -141,24 +163,23 @@ def lambda_handler(event, context):
                 "cmf": cmf_result,
             },
         )
-        
+
         logger.info(
             "Migration triggered successfully",
             extra={"migrationId": migration_id},
         )
-        
-        # Publish status event
-        eventbridge.publish_status_event(
-            migration_id=migration_id,
-            correlation_id=correlation_id,
-            current_step="trigger_migration",
-            status="IN_PROGRESS",
-            details={
-                "mgn": migration_result,
-                "cmf": cmf_result,
-            },
-        )
-        
+
+        # Bounded flush so the event is out before the Lambda freezes.
+        # A slow publish must not fail an operation that has already
+        # succeeded; the executor keeps trying until freeze.
+        try:
+            publish_future.result(timeout=1.0)
+        except TimeoutError:
+            logger.warning(
+                "Status event publish still pending at handler exit",
+                extra={"migrationId": migration_id},
+            )
+
         return {
             "statusCode": 200,
             "body": {
@@ -4,81 +4,119 @@ Validate Input Lambda Function
 Validates migration payload, checks prerequisites, verifies source/target connectivity.
 """
 import os
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from typing import Dict, Any
 
-import boto3
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
 from common.logger import get_logger
-from common.correlation import extract_correlation_id
+from common.correlation import extract_correlation_id, propagate_context
 from common.errors import PrerequisiteError, ValidationError
 from common.eventbridge_helper import EventBridgePublisher
 from common.dynamodb_helper import MigrationStateManager
+from common.aws_clients import get_client
 
 logger = get_logger(__name__)
 eventbridge = EventBridgePublisher(os.environ.get("EVENTBRIDGE_BUS_NAME"))
 state_manager = MigrationStateManager(os.environ.get("DYNAMODB_TABLE_NAME"))
 
 
-def check_aws_prerequisites(payload: Dict[str, Any]) -> None:
-    """Verify AWS resources are accessible."""
-    ec2 = boto3.client("ec2")
-    
-    try:
+def check_prerequisites(payload: Dict[str, Any]) -> None:
+    """Verify AWS resources and the MGN service are accessible.
+
+    The subnet, security-group and MGN describes are independent
+    I/O-bound calls, so they run concurrently; any failure surfaces as
+    soon as it happens instead of after the remaining checks.
+    """
+    # Memoized by get_client, so warm invocations reuse the client and
+    # its keep-alive connection pool instead of re-handshaking
+    ec2 = get_client("ec2")
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        checks = {}
+
         # Check subnet exists
         if "subnetId" in payload:
-            ec2.describe_subnets(SubnetIds=[payload["subnetId"]])
-        
+            checks["subnet"] = executor.submit(
+                ec2.describe_subnets, SubnetIds=[payload["subnetId"]]
+            )
+
         # Check security groups exist
         if "securityGroupIds" in payload:
-            ec2.describe_security_groups(
-                GroupIds=payload["securityGroupIds"]
+            checks["securityGroups"] = executor.submit(
+                ec2.describe_security_groups,
+                GroupIds=payload["securityGroupIds"],
             )
-        
-        logger.info("AWS prerequisites verified")
-        
-    except Exception as e:
-        raise PrerequisiteError(
-            f"AWS resource verification failed: {str(e)}",
-            details={"resource": "ec2"},
+
+        # Check MGN service is available
+        checks["mgn"] = executor.submit(
+            get_client("mgn").describe_source_servers
         )
 
+        wait(checks.values(), return_when=FIRST_EXCEPTION)
 
-def check_mgn_prerequisites() -> None:
-    """Verify MGN service is available."""
-    try:
-        mgn = boto3.client("mgn")
-        mgn.describe_source_servers()
-        logger.info("MGN service verified")
-    except Exception as e:
-        raise PrerequisiteError(
-            f"MGN service check failed: {str(e)}",
-            details={"service": "mgn"},
-        )
+        for resource, future in checks.items():
+            try:
+                future.result()
+            except Exception as e:
+                raise PrerequisiteError(
+                    f"Prerequisite check failed: {str(e)}",
+                    details={"resource": resource},
+                )
+
+    logger.info("AWS prerequisites verified")
+
+
+# All required payload fields are strings; the frozenset lets missing
+# fields fall out of a single C-level set difference
+_REQUIRED_FIELDS = frozenset(
+    ("migrationId", "appName", "source", "target", "environment", "wave")
+)
+
+# fastjsonschema code-generates a validator specialized to the schema
+# at import time; the frozenset checks below are the fallback when it
+# is missing
+_PAYLOAD_SCHEMA = {
+    "type": "object",
+    "required": sorted(_REQUIRED_FIELDS),
+    "properties": {field: {"type": "string"} for field in _REQUIRED_FIELDS},
+}
+
+_FAST_VALIDATE = (
+    fastjsonschema.compile(_PAYLOAD_SCHEMA) if fastjsonschema else None
+)
 
 
 def validate_payload_content(payload: Dict[str, Any]) -> None:
     """Validate payload content beyond schema."""
-    required_fields = {
-        "migrationId": "string",
-        "appName": "string",
-        "source": "string",
-        "target": "string",
-        "environment": "string",
-        "wave": "string",
-    }
-    
-    for field, field_type in required_fields.items():
-        if field not in payload:
-            raise ValidationError(
-                f"Missing required field: {field}",
-                details={"field": field},
-            )
-        
-        if not isinstance(payload[field], dict if field_type == "object" else str):
+    if _FAST_VALIDATE is not None:
+        try:
+            _FAST_VALIDATE(payload)
+        except fastjsonschema.JsonSchemaException as e:
             raise ValidationError(
-                f"Invalid type for field {field}",
-                details={"field": field, "expected": field_type},
+                str(e),
+                details={"field": e.path[-1] if e.path else None},
             )
+        return
+
+    missing = _REQUIRED_FIELDS - payload.keys()
+    if missing:
+        field = sorted(missing)[0]
+        raise ValidationError(
+            f"Missing required field: {field}",
+            details={"field": field},
+        )
+
+    bad = [f for f in _REQUIRED_FIELDS if not isinstance(payload[f], str)]
+    if bad:
+        field = sorted(bad)[0]
+        raise ValidationError(
+            f"Invalid type for field {field}",
+            details={"field": field, "expected": "string"},
+        )
 
 
 def lambda_handler(event, context):
@@ -95,7 +133,7 @@ def lambda_handler(event, context):
     try:
         detail = event.get("detail", {})
         correlation_id = extract_correlation_id(event)
-        logger.set_correlation_id(correlation_id)
+        propagate_context(correlation_id)
         
         migration_id = detail.get("migrationId")
         logger.info(
@@ -106,12 +144,18 @@ def lambda_handler(event, context):
         # Validate payload content
         validate_payload_content(detail)
         
-        # Check AWS prerequisites
-        check_aws_prerequisites(detail)
-        
-        # Check MGN prerequisites
-        check_mgn_prerequisites()
+        # Check AWS and MGN prerequisites concurrently
+        check_prerequisites(detail)
         
+        # Start the status publish first so it overlaps the DynamoDB
+        # write; consumers only need at-least-once delivery
+        publish_future = eventbridge.publish_status_event_async(
+            migration_id=migration_id,
+            correlation_id=correlation_id,
+            current_step="validate_input",
+            status="SUCCESS",
+        )
+
         # Save validation state
         state_manager.save_migration_state(
             migration_id,
@@ -121,20 +165,23 @@ def lambda_handler(event, context):
                 "correlationId": correlation_id,
             },
         )
-        
+
         logger.info(
             "Input validation successful",
             extra={"migrationId": migration_id},
         )
-        
-        # Publish success event
-        eventbridge.publish_status_event(
-            migration_id=migration_id,
-            correlation_id=correlation_id,
-            current_step="validate_input",
-            status="SUCCESS",
-        )
-        
+
+        # Bounded flush so the event is out before the Lambda freezes.
+        # A slow publish must not fail an operation that has already
+        # succeeded; the executor keeps trying until freeze.
+        try:
+            publish_future.result(timeout=1.0)
+        except TimeoutError:
+            logger.warning(
+                "Status event publish still pending at handler exit",
+                extra={"migrationId": migration_id},
+            )
+
         return {
             "statusCode": 200,
             "body": {
@@ -3,75 +3,228 @@ Verify Migration Lambda Function
 Polls MGN status, validates replication lag, checks application health
 """
 
+import atexit
 import json
 import logging
+import os
+import threading
 import boto3
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, Any, Tuple
 
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
 from common.logger import get_logger
-from common.correlation import get_correlation_id, propagate_context
-from common.dynamodb_helper import update_migration_state
+from common.correlation import get_correlation_id
+from common.errors import VerificationError
+from common.eventbridge_helper import EventBridgePublisher
 
 logger = get_logger(__name__)
-mgn_client = boto3.client('mgn')
-cloudwatch = boto3.client('cloudwatch')
-dynamodb = boto3.resource('dynamodb')
+eventbridge = EventBridgePublisher(os.environ.get('EVENTBRIDGE_BUS_NAME'))
+
+# Shared client tuning: keep-alive so warm invocations skip the
+# TCP+TLS handshake, a pool wide enough for concurrent checks, and
+# adaptive retries for MGN/CloudWatch throttles
+BOTO_CFG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 5}
+)
+
+mgn_client = boto3.client('mgn', config=BOTO_CFG)
+cloudwatch = boto3.client('cloudwatch', config=BOTO_CFG)
+ec2_client = boto3.client('ec2', config=BOTO_CFG)
+dynamodb = boto3.resource('dynamodb', config=BOTO_CFG)
+
+# Bind the table once per container; Table() builds its resource model
+# lazily, so rebuilding it on every state write was paying that cost on
+# each poll of a warm Lambda
+MIGRATION_TABLE = dynamodb.Table(
+    os.environ.get('DYNAMODB_TABLE_NAME', 'migration-state')
+)
+
+# Workers for overlapping the independent verification calls; module
+# scope so warm invocations reuse the threads
+executor = ThreadPoolExecutor(max_workers=4)
+
+# Step Functions re-polls verification on a schedule; job status cannot
+# meaningfully change within a few seconds, so recent describe_jobs
+# results are served from this per-container cache
+_STATUS_TTL_SECONDS = int(os.environ.get('MGN_STATUS_TTL_MS', '5000')) / 1000
+
+# Job states in which replication lag, app health and metrics are
+# worth checking; mid-flight polls return 202 before any of that
+_TERMINAL_JOB_STATES = frozenset(('COMPLETED', 'SUCCEEDED'))
+_IN_PROGRESS_STATES = frozenset(('STARTED', 'RUNNING', 'PENDING', 'SUBMITTED'))
+_STATUS_CACHE_MAX_AGE_SECONDS = 60
+_status_cache: Dict[str, Tuple[float, Tuple[bool, str, str]]] = {}
+
+# Static shape of the "poll again" reply; the hot path copies this and
+# fills in only the per-invocation fields
+_IN_PROGRESS_RESPONSE = {
+    'statusCode': 202,
+    'success': True,
+    'readyForCutover': False,
+    'message': 'Migration in progress, check back later'
+}
+
+# Migrations this container has already marked VERIFYING_MIGRATION;
+# repeat polls of a mid-flight job skip the redundant UpdateItem
+_marked_verifying = set()
+
+
+def update_migration_state(migration_id: str, status: str, details: Dict[str, Any]):
+    """Write migration status straight through the pre-bound table"""
+    try:
+        MIGRATION_TABLE.update_item(
+            Key={'migrationId': migration_id},
+            UpdateExpression='SET #s = :status, executionDetails = :details',
+            ExpressionAttributeNames={'#s': 'status'},
+            ExpressionAttributeValues={
+                ':status': status,
+                ':details': details
+            }
+        )
+    except Exception as e:
+        logger.error(f"Failed to update migration state: {str(e)}")
 
 
 def check_mgn_replication_status(job_id: str) -> Tuple[bool, str, str]:
-    """Check MGN job status"""
+    """Check MGN job status, serving recent results from the TTL cache"""
     try:
+        now = time.monotonic()
+
+        # Bound memory by dropping anything stale, then serve fresh hits
+        for key in [k for k, (fetched, _) in _status_cache.items()
+                    if now - fetched > _STATUS_CACHE_MAX_AGE_SECONDS]:
+            del _status_cache[key]
+
+        cached = _status_cache.get(job_id)
+        if cached and now - cached[0] < _STATUS_TTL_SECONDS:
+            return cached[1]
+
         # Describe job to get status
         jobs = mgn_client.describe_jobs(filters={'jobIDs': [job_id]})
-        
+
         if not jobs.get('items'):
             return False, "Job not found", "UNKNOWN"
-        
+
         job = jobs['items'][0]
         job_status = job['status']
-        
+
         logger.info(f"Job {job_id} status: {job_status}")
-        
-        return True, "Status retrieved", job_status
+
+        result = (True, "Status retrieved", job_status)
+        # Stamp after the call so the TTL covers response age, not
+        # request start
+        _status_cache[job_id] = (time.monotonic(), result)
+
+        return result
 
     except Exception as e:
         logger.error(f"Failed to check job status: {str(e)}")
         return False, str(e), "ERROR"
 
 
-def check_replication_lag(migration_id: str) -> Tuple[bool, int]:
-    """Check data replication lag in seconds"""
+def check_replication_lag(source_vm_id: str) -> Tuple[bool, int]:
+    """Check data replication lag in seconds for one source server"""
     try:
-        # Get source servers to check replication lag
-        source_servers = mgn_client.describe_source_servers()
-        
-        min_lag = float('inf')
-        
-        for server in source_servers.get('items', []):
-            replication_status = server.get('replicationProperties', {})
-            
-            # Check last seen timestamp
-            last_seen = replication_status.get('lastSeenByServiceDateTime')
-            
-            if last_seen:
-                lag_seconds = int((time.time() - last_seen.timestamp()))
-                logger.info(f"Server {server['sourceServerID']} replication lag: {lag_seconds}s")
-                
-                if lag_seconds < min_lag:
-                    min_lag = lag_seconds
-        
-        if min_lag == float('inf'):
+        if not source_vm_id:
+            logger.warning("No source server ID; cannot determine replication lag")
+            return True, 0
+
+        # Only this migration's server matters; the targeted filter
+        # avoids paging the whole fleet through the Lambda, and the
+        # explicit cap bounds the response to the one matching server
+        source_servers = mgn_client.describe_source_servers(
+            filters={'sourceServerIDs': [source_vm_id]},
+            maxResults=1
+        )
+
+        items = source_servers.get('items')
+        if not items:
+            logger.warning(f"Source server {source_vm_id} not found")
+            return True, 0
+
+        replication_status = items[0].get('replicationProperties', {})
+        last_seen = replication_status.get('lastSeenByServiceDateTime')
+
+        if not last_seen:
             logger.warning("Could not determine replication lag")
             return True, 0
-        
-        return True, min_lag
+
+        lag_seconds = int(time.time() - last_seen.timestamp())
+        logger.info(f"Server {source_vm_id} replication lag: {lag_seconds}s")
+
+        return True, lag_seconds
 
     except Exception as e:
         logger.error(f"Failed to check replication lag: {str(e)}")
         return False, -1
 
 
+# DescribeInstanceStatus accepts up to 100 IDs per call, but each
+# verification was paying a full HTTP round trip for a single ID.
+# Lookups arriving within the coalescing window are merged into one
+# batched call whose results fan back out through per-ID futures; a
+# lone invocation degenerates to a single call with a 50ms delay
+_pending_status_checks: Dict[str, Future] = {}
+_status_check_lock = threading.Lock()
+_STATUS_COALESCE_WINDOW_SECONDS = 0.05
+_STATUS_BATCH_LIMIT = 100
+
+
+def _flush_status_checks():
+    """Drain pending lookups into batched DescribeInstanceStatus calls"""
+    time.sleep(_STATUS_COALESCE_WINDOW_SECONDS)
+
+    with _status_check_lock:
+        pending = dict(_pending_status_checks)
+        _pending_status_checks.clear()
+
+    if not pending:
+        return
+
+    try:
+        statuses = {}
+        instance_ids = list(pending)
+        for start in range(0, len(instance_ids), _STATUS_BATCH_LIMIT):
+            response = ec2_client.describe_instance_status(
+                InstanceIds=instance_ids[start:start + _STATUS_BATCH_LIMIT]
+            )
+            for status in response.get('InstanceStatuses', []):
+                statuses[status['InstanceId']] = status
+
+        for instance_id, future in pending.items():
+            future.set_result(statuses.get(instance_id))
+    except Exception as e:
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(e)
+
+
+def _get_instance_status(instance_id: str):
+    """Fetch one instance's status via the shared coalesced batch call.
+
+    The first caller in a window owns the flush, so the batch never
+    depends on a free executor worker; siblings just block on their
+    future until the owner fans the results back out.
+    """
+    with _status_check_lock:
+        future = _pending_status_checks.get(instance_id)
+        owns_flush = not _pending_status_checks
+        if future is None:
+            future = Future()
+            _pending_status_checks[instance_id] = future
+
+    if owns_flush:
+        _flush_status_checks()
+
+    return future.result()
+
+
 def verify_application_health(payload: Dict[str, Any]) -> Tuple[bool, str]:
     """Verify application health on target"""
     try:
@@ -90,15 +243,12 @@ def verify_application_health(payload: Dict[str, Any]) -> Tuple[bool, str]:
         
         # Default health check via EC2 status checks
         if target_instance_id:
-            ec2 = boto3.client('ec2')
             try:
-                status_response = ec2.describe_instance_status(InstanceIds=[target_instance_id])
-                
-                if not status_response.get('InstanceStatuses'):
+                instance_status = _get_instance_status(target_instance_id)
+
+                if instance_status is None:
                     return False, "Instance status checks not ready"
-                
-                instance_status = status_response['InstanceStatuses'][0]
-                
+
                 # Check instance and system status
                 instance_health = instance_status['InstanceStatus']['Status']
                 system_health = instance_status['SystemStatus']['Status']
@@ -109,9 +259,17 @@ def verify_application_health(payload: Dict[str, Any]) -> Tuple[bool, str]:
                 logger.info(f"Application health verified for {app_name}")
                 return True, "Health check passed"
                 
-            except Exception as e:
-                logger.warning(f"Could not verify EC2 health: {str(e)}")
-                return True, "Health check skipped (instance not available)"
+            except ClientError as e:
+                # A missing instance is a legitimate skip; anything else
+                # is a real error and surfaces as a failed check instead
+                # of being silently swallowed
+                if e.response['Error']['Code'] in (
+                    'InvalidInstanceID.NotFound',
+                    'InvalidInstanceID.Malformed'
+                ):
+                    logger.warning(f"Could not verify EC2 health: {str(e)}")
+                    return True, "Health check skipped (instance not available)"
+                raise
         
         return True, "Health check skipped (no target instance)"
 
@@ -120,35 +278,68 @@ def verify_application_health(payload: Dict[str, Any]) -> Tuple[bool, str]:
         return False, str(e)
 
 
-def publish_health_metrics(migration_id: str, replication_lag: int, health_status: str):
-    """Publish custom metrics to CloudWatch"""
+# Metric datums are buffered and shipped in batches so concurrent
+# verifications in one warm container share a single PutMetricData
+# call instead of one HTTP request each
+_METRIC_BUFFER = []
+_metric_lock = threading.Lock()
+_METRIC_FLUSH_THRESHOLD = 500
+_NAMESPACE = 'MigrationOrchestration'
+
+
+def _dim(migration_id: str):
+    """Build the shared MigrationId dimension list"""
+    return [{'Name': 'MigrationId', 'Value': migration_id}]
+
+
+def publish_health_metrics(migration_id: str, replication_lag: int, health_is_healthy: bool):
+    """Queue custom metrics for the next CloudWatch flush"""
+    dimensions = _dim(migration_id)
+
+    with _metric_lock:
+        _METRIC_BUFFER.extend([
+            {
+                'MetricName': 'ReplicationLag',
+                'Value': replication_lag,
+                'Unit': 'Seconds',
+                'Dimensions': dimensions
+            },
+            {
+                'MetricName': 'HealthStatus',
+                'Value': 1 if health_is_healthy else 0,
+                'Unit': 'None',
+                'Dimensions': dimensions
+            }
+        ])
+        over_threshold = len(_METRIC_BUFFER) >= _METRIC_FLUSH_THRESHOLD
+
+    logger.info(f"Health metrics queued for {migration_id}")
+
+    if over_threshold:
+        flush_health_metrics()
+
+
+def flush_health_metrics():
+    """Ship all buffered metrics in PutMetricData batches of up to 1000"""
+    with _metric_lock:
+        batch, _METRIC_BUFFER[:] = _METRIC_BUFFER[:], []
+
     try:
-        cloudwatch.put_metric_data(
-            Namespace='MigrationOrchestration',
-            MetricData=[
-                {
-                    'MetricName': 'ReplicationLag',
-                    'Value': replication_lag,
-                    'Unit': 'Seconds',
-                    'Dimensions': [
-                        {'Name': 'MigrationId', 'Value': migration_id}
-                    ]
-                },
-                {
-                    'MetricName': 'HealthStatus',
-                    'Value': 1 if health_status == 'healthy' else 0,
-                    'Unit': 'None',
-                    'Dimensions': [
-                        {'Name': 'MigrationId', 'Value': migration_id}
-                    ]
-                }
-            ]
-        )
-        logger.info(f"Health metrics published for {migration_id}")
+        for start in range(0, len(batch), 1000):
+            cloudwatch.put_metric_data(
+                Namespace=_NAMESPACE,
+                MetricData=batch[start:start + 1000]
+            )
+        if batch:
+            logger.info(f"Published {len(batch)} buffered metrics")
     except Exception as e:
         logger.error(f"Failed to publish metrics: {str(e)}")
 
 
+# Last-resort flush when the container is reclaimed
+atexit.register(flush_health_metrics)
+
+
 def lambda_handler(event, context):
     """
     Verify migration status and application health
@@ -159,7 +350,6 @@ def lambda_handler(event, context):
         dict: Verification result with status and metrics
     """
     correlation_id = get_correlation_id()
-    propagate_context(correlation_id)
     
     migration_id = event.get('migrationId') or event.get('detail', {}).get('migrationId')
     job_id = event.get('jobId')
@@ -167,24 +357,40 @@ def lambda_handler(event, context):
     logger.info(f"Starting migration verification for: {migration_id}, Job ID: {job_id}")
     
     try:
+        # One wall-clock read serves every timestamp in this invocation
+        now_ts = int(time.time())
         payload = event.get('detail', event)
-        
+
         if not job_id:
-            raise Exception("Job ID is required for verification")
-        
+            raise VerificationError("Job ID is required for verification")
+
+        # Check MGN replication status
+        success, message, job_status = check_mgn_replication_status(job_id)
+
+        # Hot path: a repeat poll of a mid-flight job changes nothing in
+        # DynamoDB, so answer straight from the response template
+        if (success and job_status in _IN_PROGRESS_STATES
+                and migration_id in _marked_verifying):
+            response = dict(_IN_PROGRESS_RESPONSE)
+            response['migrationId'] = migration_id
+            response['jobId'] = job_id
+            response['jobStatus'] = job_status
+            response['correlationId'] = correlation_id
+            return response
+
         # Update migration state
         update_migration_state(migration_id, 'VERIFYING_MIGRATION', {
             'step': 'verify_migration',
             'jobId': job_id,
             'correlationId': correlation_id,
-            'timestamp': int(time.time())
+            'timestamp': now_ts
         })
-        
-        # Check MGN replication status
-        success, message, job_status = check_mgn_replication_status(job_id)
-        
+        _marked_verifying.add(migration_id)
+
         if not success:
             logger.error(f"Failed to check MGN status: {message}")
+            # The next poll must re-assert the state, not fast-path it
+            _marked_verifying.discard(migration_id)
             return {
                 'statusCode': 500,
                 'success': False,
@@ -195,34 +401,36 @@ def lambda_handler(event, context):
                 'readyForCutover': False
             }
         
-        # Check if job is complete
-        if job_status not in ['COMPLETED', 'SUCCEEDED']:
+        # Check if job is complete; in-progress polls return here and
+        # never pay for the lag/health/metric calls below
+        if job_status not in _TERMINAL_JOB_STATES:
             logger.info(f"Job still in progress: {job_status}")
-            return {
-                'statusCode': 202,
-                'success': True,
-                'migrationId': migration_id,
-                'jobId': job_id,
-                'jobStatus': job_status,
-                'correlationId': correlation_id,
-                'readyForCutover': False,
-                'message': 'Migration in progress, check back later'
-            }
-        
-        # Check replication lag
-        success, replication_lag = check_replication_lag(migration_id)
+            response = dict(_IN_PROGRESS_RESPONSE)
+            response['migrationId'] = migration_id
+            response['jobId'] = job_id
+            response['jobStatus'] = job_status
+            response['correlationId'] = correlation_id
+            return response
         
+        # Replication lag and application health hit different services;
+        # overlap the two round trips
+        lag_future = executor.submit(check_replication_lag, payload.get('sourceVmId'))
+        health_future = executor.submit(verify_application_health, payload)
+
+        success, replication_lag = lag_future.result()
+
         if not success:
             logger.warning(f"Could not verify replication lag: {replication_lag}")
             replication_lag = 0
-        
-        # Check application health
-        health_success, health_message = verify_application_health(payload)
-        
+
+        health_success, health_message = health_future.result()
+
         health_status = "healthy" if health_success else "unhealthy"
-        
-        # Publish metrics
-        publish_health_metrics(migration_id, replication_lag, health_status)
+
+        # Queue metrics and flush fire-and-forget; the handler does not
+        # need to wait for the CloudWatch ack
+        publish_health_metrics(migration_id, replication_lag, health_success)
+        executor.submit(flush_health_metrics)
         
         # Determine if ready for cutover
         ready_for_cutover = health_success and job_status == 'COMPLETED'
@@ -234,6 +442,20 @@ def lambda_handler(event, context):
             logger.warning(f"Migration {migration_id} verification failed: {health_message}")
             state_name = 'VERIFICATION_FAILED'
         
+        # Start the status publish first so it overlaps the DynamoDB
+        # write; consumers only need at-least-once delivery
+        publish_future = eventbridge.publish_status_event_async(
+            migration_id=migration_id,
+            correlation_id=correlation_id,
+            current_step='verify_migration',
+            status='SUCCESS' if ready_for_cutover else 'FAILED',
+            details={
+                'jobStatus': job_status,
+                'replicationLag': replication_lag,
+                'healthStatus': health_status
+            }
+        )
+
         # Update migration state
         update_migration_state(migration_id, state_name, {
             'step': 'verify_migration',
@@ -242,9 +464,18 @@ def lambda_handler(event, context):
             'healthStatus': health_status,
             'readyForCutover': ready_for_cutover,
             'correlationId': correlation_id,
-            'timestamp': int(time.time())
+            'timestamp': now_ts
         })
-        
+        _marked_verifying.discard(migration_id)
+
+        # Bounded flush so the event is out before the Lambda freezes.
+        # A slow publish must not overwrite a state that was just
+        # written; the executor keeps trying until freeze.
+        try:
+            publish_future.result(timeout=1.0)
+        except TimeoutError:
+            logger.warning("Status event publish still pending at handler exit")
+
         return {
             'statusCode': 200,
             'success': ready_for_cutover,
@@ -255,19 +486,35 @@ def lambda_handler(event, context):
             'healthStatus': health_status,
             'readyForCutover': ready_for_cutover,
             'correlationId': correlation_id,
+            # Downstream states select $.payload from this output, so
+            # the echo is part of the state machine contract
             'payload': payload
         }
 
     except Exception as e:
-        logger.error(f"Migration verification failed: {str(e)}", exc_info=True)
+        logger.error(f"Migration verification failed: {str(e)}")
         
         # Update migration state
         update_migration_state(migration_id, 'VERIFICATION_ERROR', {
             'error': str(e),
             'correlationId': correlation_id,
-            'timestamp': int(time.time())
+            'timestamp': now_ts
         })
-        
+        # The stored state is no longer VERIFYING_MIGRATION, so the
+        # fast path must not skip restoring it on the next poll
+        _marked_verifying.discard(migration_id)
+
+        # Best-effort failure event; verification already failed
+        try:
+            eventbridge.publish_failure_event(
+                migration_id=migration_id,
+                correlation_id=correlation_id,
+                error_code=getattr(e, 'error_code', 'VERIFICATION_ERROR'),
+                error_message=str(e)
+            )
+        except Exception:
+            pass
+
         return {
             'statusCode': 500,
             'success': False,
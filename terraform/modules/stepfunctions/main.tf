@@ -175,7 +175,16 @@ resource "aws_sfn_state_machine" "migration_orchestration" {
       Rollback = {
         Type     = "Task"
         Resource = var.rollback_handler_arn
-        Next     = "MigrationFailed"
+        Next     = "WaitForSourceRestore"
+      }
+
+      # Snapshot restores signalled by the rollback Lambda complete
+      # asynchronously; waiting here is free, waiting inside the
+      # Lambda is billed duration
+      WaitForSourceRestore = {
+        Type    = "Wait"
+        Seconds = 5
+        Next    = "MigrationFailed"
       }
 
       MigrationFailed = {